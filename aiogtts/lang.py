@@ -50,6 +50,24 @@ def _extra_langs():
     }
 
 
+# '<deprecated lang>': '<fallback>', flattened once instead of being
+# rebuilt and linearly searched on every call
+_DEPRECATED_LANGS = {
+    deprecated_lang: fallback_lang
+    for fallback_lang, deprecated_langs in {
+        # '<fallback>': [<list of deprecated langs>]
+        'en': ['en-us', 'en-ca', 'en-uk', 'en-gb', 'en-au', 'en-gh', 'en-in',
+               'en-ie', 'en-nz', 'en-ng', 'en-ph', 'en-za', 'en-tz'],
+        'fr': ['fr-ca', 'fr-fr'],
+        'pt': ['pt-br', 'pt-pt'],
+        'es': ['es-es', 'es-us'],
+        'zh-CN': ['zh-cn'],
+        'zh-TW': ['zh-tw'],
+    }.items()
+    for deprecated_lang in deprecated_langs
+}
+
+
 def _fallback_deprecated_lang(lang):
     """Languages Google Text-to-Speech used to support.
 
@@ -69,24 +87,13 @@ def _fallback_deprecated_lang(lang):
         ``en-gb`` returns ``en``.
     """
 
-    deprecated = {
-        # '<fallback>': [<list of deprecated langs>]
-        'en': ['en-us', 'en-ca', 'en-uk', 'en-gb', 'en-au', 'en-gh', 'en-in',
-               'en-ie', 'en-nz', 'en-ng', 'en-ph', 'en-za', 'en-tz'],
-        'fr': ['fr-ca', 'fr-fr'],
-        'pt': ['pt-br', 'pt-pt'],
-        'es': ['es-es', 'es-us'],
-        'zh-CN': ['zh-cn'],
-        'zh-TW': ['zh-tw'],
-    }
-
-    for fallback_lang, deprecated_langs in deprecated.items():
-        if lang.lower() in deprecated_langs:
-            msg = f"'{lang}' has been deprecated, falling back to '{fallback_lang}'."
+    fallback_lang = _DEPRECATED_LANGS.get(lang.lower())
+    if fallback_lang is not None:
+        msg = f"'{lang}' has been deprecated, falling back to '{fallback_lang}'."
 
-            warn(msg, DeprecationWarning)
-            log.warning(msg)
+        warn(msg, DeprecationWarning)
+        log.warning(msg)
 
-            return fallback_lang
+        return fallback_lang
 
     return lang
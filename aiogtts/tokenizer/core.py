@@ -119,18 +119,36 @@ class PreProcessorRegex:
             rb = RegexBuilder([arg], search_func, flags)
             self.regexes.append(rb.regex)
 
+        # Every pattern shares the same `repl`, so group-less patterns can
+        # be joined into a single alternation and substituted in one pass
+        # over the text. Patterns with capturing groups keep the sequential
+        # passes: joining would renumber the groups, and a backreference to
+        # an unmatched alternative substitutes as empty. No patterns at all
+        # stays sequential too — an empty join would match at every position.
+        self.combined_regex = None
+        if self.regexes:
+            combined = RegexBuilder(search_args, search_func, flags).regex
+            if combined.groups == 0:
+                self.combined_regex = combined
+
     def run(self, text):
         """Run each regex substitution on ``text``.
 
+        Patterns without capturing groups are applied as one combined
+        alternation in a single pass; patterns with capturing groups are
+        applied sequentially so backreferences keep their meaning.
+
         Args:
             text (string): the input text.
 
         Returns:
-            string: text after all substitutions have been sequentially
-            applied.
+            string: text after all substitutions have been applied.
 
         """
 
+        if self.combined_regex is not None:
+            return self.combined_regex.sub(self.repl, text)
+
         for regex in self.regexes:
             text = regex.sub(self.repl, text)
         return text
@@ -187,20 +205,33 @@ class PreProcessorSub:
             pp = PreProcessorRegex([pattern], search_func, repl, flags)
             self.pre_processors.append(pp)
 
+        # The pairs are joined into a single alternation so the text is
+        # scanned once; each pattern gets its own capturing group so the
+        # replacement is picked by which alternative matched. No pairs
+        # means nothing to substitute (an empty join would match anywhere)
+        self.repls = [repl for _, repl in sub_pairs]
+        self.combined_regex = None
+        if self.repls:
+            self.combined_regex = re.compile(
+                '|'.join(f'({re.escape(pattern)})' for pattern, _ in sub_pairs), flags)
+
     def run(self, text):
-        """Run each substitution on ``text``.
+        """Run all substitutions on ``text`` in a single pass.
 
         Args:
             text (string): the input text.
 
         Returns:
-            string: text after all substitutions have been sequentially
-            applied.
+            string: text after all substitutions have been applied.
         """
 
-        for pp in self.pre_processors:
-            text = pp.run(text)
-        return text
+        if self.combined_regex is None:
+            return text
+
+        def repl(match):
+            return self.repls[match.lastindex - 1]
+
+        return self.combined_regex.sub(repl, text)
 
     def __repr__(self):
         return ', '.join([str(pp) for pp in self.pre_processors])
@@ -272,7 +303,7 @@ class Tokenizer:
         Finally, looking at ``t``, we get them combined::
 
             >>> print(t)
-            're.compile('\\,|a\\.|b\\.|c\\.', re.IGNORECASE)
+            're.compile('(?:\\,)|(?:a\\.|b\\.|c\\.)', re.IGNORECASE)
              from: [<function case1 at 0x10bbcdd08>, <function case2 at 0x10b5c5e18>]'
 
         It can then be run on any string of text::
@@ -297,7 +328,9 @@ class Tokenizer:
         for func in self.regex_funcs:
             alts.append(func())
 
-        pattern = '|'.join(alt.pattern for alt in alts)
+        # Non-capturing groups keep each case's pattern self-contained and
+        # prevent group-number collisions between joined alternatives
+        pattern = '|'.join(f'(?:{alt.pattern})' for alt in alts)
         return re.compile(pattern, self.flags)
 
     def run(self, text):
@@ -312,5 +345,29 @@ class Tokenizer:
 
         return self.total_regex.split(text)
 
+    def iter_run(self, text):
+        """Tokenize `text` lazily.
+
+        Yields the same tokens as :meth:`run`, one at a time, without
+        materializing the whole token list.
+
+        Note:
+            Unlike ``regex.split()``, capturing groups inside tokenizer
+            cases are never yielded; the matched split point is always
+            discarded whole.
+
+        Args:
+            text (string): the input text to tokenize.
+
+        Yields:
+            string: the next token.
+        """
+
+        start = 0
+        for match in self.total_regex.finditer(text):
+            yield text[start:match.start()]
+            start = match.end()
+        yield text[start:]
+
     def __repr__(self):
         return f'{self.total_regex} from: {self.regex_funcs}'
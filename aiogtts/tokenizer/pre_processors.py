@@ -1,6 +1,25 @@
 import re
 from . import PreProcessorRegex, PreProcessorSub, symbols
 
+# The pre-processors are stateless; build each (and compile its regexes)
+# once at import instead of on every call
+_tone_marks = PreProcessorRegex(
+    search_args=symbols.TONE_MARKS,
+    search_func=lambda x: f'(?<={x})',
+    repl=' ')
+
+_end_of_line = PreProcessorRegex(
+    search_args='-',
+    search_func=lambda x: f'{x}\n',
+    repl='')
+
+_abbreviations = PreProcessorRegex(
+    search_args=symbols.ABBREVIATIONS,
+    search_func=lambda x: rf'(?<={x})(?=\.).',
+    repl='', flags=re.IGNORECASE)
+
+_word_sub = PreProcessorSub(sub_pairs=symbols.SUB_PAIRS)
+
 
 def tone_marks(text):
     """Add a space after tone-modifying punctuation.
@@ -9,10 +28,7 @@ def tone_marks(text):
     punctuation mark, make sure there's whitespace after.
     """
 
-    return PreProcessorRegex(
-        search_args=symbols.TONE_MARKS,
-        search_func=lambda x: f'(?<={x})',
-        repl=' ').run(text)
+    return _tone_marks.run(text)
 
 
 def end_of_line(text):
@@ -21,10 +37,7 @@ def end_of_line(text):
     Remove '<hyphen><newline>'.
     """
 
-    return PreProcessorRegex(
-        search_args='-',
-        search_func=lambda x: f'{x}\n',
-        repl='').run(text)
+    return _end_of_line.run(text)
 
 
 def abbreviations(text):
@@ -41,13 +54,10 @@ def abbreviations(text):
         :class:`PreProcessorSub` pre-processor. Ex.: 'Esq.', 'Esquire'.
     """
 
-    return PreProcessorRegex(
-        search_args=symbols.ABBREVIATIONS,
-        search_func=lambda x: rf'(?<={x})(?=\.).',
-        repl='', flags=re.IGNORECASE).run(text)
+    return _abbreviations.run(text)
 
 
 def word_sub(text):
     """Word-for-word substitutions."""
 
-    return PreProcessorSub(sub_pairs=symbols.SUB_PAIRS).run(text)
+    return _word_sub.run(text)
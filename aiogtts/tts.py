@@ -1,20 +1,48 @@
 import re
 import json
 import base64
+import random
 import aiohttp
 import asyncio
 import logging
 
+from yarl import URL
+from multidict import CIMultiDict
+
 from urllib.parse import quote
 from .lang import tts_langs, _fallback_deprecated_lang
-from .utils import _minimize, _clean_tokens, _translate_url
+from .utils import _minimize, _clean_tokens, _translate_url, _ALL_PUNC_OR_SPACE
 from .tokenizer import pre_processors, Tokenizer, tokenizer_cases
+from .tokenizer.symbols import ALL_PUNC
 
 __all__ = ['aiogTTS', 'aiogTTSError']
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Default text pipeline, built once and shared by every aiogTTS instance
+_DEFAULT_PRE_PROCESSORS = (
+    pre_processors.tone_marks,
+    pre_processors.end_of_line,
+    pre_processors.abbreviations,
+    pre_processors.word_sub
+)
+
+# Base64 mp3 payload inside a batchexecute response; matched on the raw
+# bytes, and non-greedy so the engine never backtracks over the audio data
+_AUDIO_RE = re.compile(rb'jQ1olc","\[\\"(.*?)\\"]')
+
+# Any character that could make one of the default pre-processors or the
+# token cleaning do actual work; its absence allows a tokenizing fast path
+_PUNC_RE = re.compile(f'[{re.escape(ALL_PUNC)}]')
+
+_DEFAULT_TOKENIZER = Tokenizer([
+    tokenizer_cases.tone_marks,
+    tokenizer_cases.period_comma,
+    tokenizer_cases.colon,
+    tokenizer_cases.other_punctuation
+])
+
 
 class Speed:
     """Read Speed
@@ -77,29 +105,39 @@ class aiogTTS:
     }
     GOOGLE_TTS_RPC = 'jQ1olc'
 
-    def __init__(
-            self,
-            pre_processor_funcs=[
-                pre_processors.tone_marks,
-                pre_processors.end_of_line,
-                pre_processors.abbreviations,
-                pre_processors.word_sub
-            ],
-            tokenizer_func=Tokenizer([
-                tokenizer_cases.tone_marks,
-                tokenizer_cases.period_comma,
-                tokenizer_cases.colon,
-                tokenizer_cases.other_punctuation
-            ]).run
-    ):
+    # Ready-made header multidict, so aiohttp doesn't rebuild one per request
+    _GOOGLE_TTS_HEADERS_MD = CIMultiDict(GOOGLE_TTS_HEADERS)
 
+    def __init__(self, pre_processor_funcs=None, tokenizer_func=None):
         self.s = None
 
+        if pre_processor_funcs is None:
+            pre_processor_funcs = _DEFAULT_PRE_PROCESSORS
+
+        # The default tokenizer can stream its tokens; an arbitrary
+        # tokenizer_func callable is only known to return a list
+        self._iter_tokenizer = None
+        if tokenizer_func is None:
+            tokenizer_func = _DEFAULT_TOKENIZER.run
+            self._iter_tokenizer = _DEFAULT_TOKENIZER.iter_run
+
         self.pre_processor_funcs = pre_processor_funcs
         self.tokenizer_func = tokenizer_func
 
-    def __del__(self):
-        asyncio.get_event_loop().create_task(self.session.close())
+        self._langs_cache = None
+
+    async def close(self):
+        """Close the underlying :class:`aiohttp.ClientSession`, if any."""
+
+        if self.s is not None:
+            await self.s.close()
+            self.s = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
 
     @property
     def session(self):
@@ -108,7 +146,8 @@ class aiogTTS:
     @session.getter
     def session(self):
         if self.s is None:
-            self.s = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+            self.s = aiohttp.ClientSession(connector=connector)
         return self.s
 
     @session.setter
@@ -116,69 +155,93 @@ class aiogTTS:
         self.s = v
 
     def _tokenize(self, text):
+        """Pre-process, tokenize and minimize ``text``, yielding
+        API-sized chunks lazily instead of materializing them all at once.
+        """
+
         text = text.strip()
+        max_chars = self.GOOGLE_TTS_MAX_CHARS
+
+        if (self.pre_processor_funcs is _DEFAULT_PRE_PROCESSORS
+                and len(text) <= max_chars
+                and not _PUNC_RE.search(text)):
+            # Without punctuation every default pre-processor is a no-op,
+            # so short text can be sent as-is
+            if text:
+                yield text
+            return
 
         for pp in self.pre_processor_funcs:
             log.debug(f'pre-processing: {pp}')
             text = pp(text)
 
-        if len(text) <= self.GOOGLE_TTS_MAX_CHARS:
-            return _clean_tokens([text])
+        if len(text) <= max_chars:
+            yield from _clean_tokens([text])
+            return
 
         log.debug(f'tokenizing: {self.tokenizer_func}')
-        tokens = self.tokenizer_func(text)
+        if self._iter_tokenizer is not None:
+            tokens = self._iter_tokenizer(text)
+        else:
+            tokens = self.tokenizer_func(text)
 
-        tokens = _clean_tokens(tokens)
+        # Local bindings for the per-token loop (LOAD_FAST over
+        # attribute/global lookups)
+        minimize = _minimize
+        is_punc_or_space = _ALL_PUNC_OR_SPACE.match
 
-        min_tokens = []
         for t in tokens:
-            min_tokens += _minimize(t, ' ', self.GOOGLE_TTS_MAX_CHARS)
-
-        min_tokens = [t for t in min_tokens if t]
-
-        return min_tokens
+            t = t.strip()
+            if is_punc_or_space(t):
+                continue
+            for min_t in minimize(t, ' ', max_chars):
+                if min_t:
+                    yield min_t
 
     def _prepare_requests(self, text, lang, tld, slow, lang_check):
-        """Created the TTS API the request(s) without sending them.
+        """Prepare the TTS API request(s) without sending them.
 
         Returns:
-            list: ``requests.PreparedRequests_``. <https://2.python-requests.org/en/master/api/#requests.PreparedRequest>`_``.
+            tuple: The translate URL and the list of RPC payloads,
+            one per text part, in speaking order.
         """
 
         if lang_check:
             lang = _fallback_deprecated_lang(lang)
 
             try:
-                if lang not in tts_langs():
+                if self._langs_cache is None:
+                    self._langs_cache = tts_langs()
+                if lang not in self._langs_cache:
                     raise ValueError(f'Language not supported: {lang}')
             except RuntimeError as e:
                 log.debug(str(e), exc_info=True)
                 log.warning(str(e))
 
-        translate_url = _translate_url(tld=tld, path='_/TranslateWebserverUi/data/batchexecute')
+        # Parse the URL once here rather than once per chunk request
+        translate_url = URL(_translate_url(tld=tld, path='_/TranslateWebserverUi/data/batchexecute'))
 
-        text_parts = self._tokenize(text)
+        text_parts = list(self._tokenize(text))
         log.debug(f'text_parts: {text_parts}')
         assert text_parts, 'No text to send to TTS API'
 
-        prepared_requests = []
+        payloads = []
         for idx, part in enumerate(text_parts):
             data = self._package_rpc(part, lang, slow)
 
             log.debug(f'data-{idx}: {data}')
 
-            r = self.session.post(translate_url, data=data, headers=self.GOOGLE_TTS_HEADERS)
-
-            prepared_requests.append(r)
+            payloads.append(data)
 
-        return prepared_requests
+        return translate_url, payloads
 
     def _package_rpc(self, text, lang, slow):
-        parameter = [text, lang, Speed.SLOW if slow else Speed.NORMAL, 'null']
-        escaped_parameter = json.dumps(parameter, separators=(',', ':'))
+        # The RPC envelope is fixed; only the two strings need JSON escaping.
+        # Produces the same bytes as dumping the full nested structure
+        slow_json = 'true' if slow else 'null'
+        escaped_parameter = f'[{json.dumps(text)},{json.dumps(lang)},{slow_json},"null"]'
 
-        rpc = [[[self.GOOGLE_TTS_RPC, escaped_parameter, None, 'generic']]]
-        escaped_rpc = json.dumps(rpc, separators=(',', ':'))
+        escaped_rpc = f'[[["{self.GOOGLE_TTS_RPC}",{json.dumps(escaped_parameter)},null,"generic"]]]'
         return f'f.req={quote(escaped_rpc)}&'
 
     async def write_to_fp(self, text, fp, lang='en', tld='com', slow=False, lang_check=True):
@@ -208,34 +271,56 @@ class aiogTTS:
             TypeError: When ``fp`` is not a file-like object that takes bytes.
         """
 
-        prepared_requests = self._prepare_requests(text, lang, tld, slow, lang_check)
-        for idx, pr in enumerate(prepared_requests):
-            try:
-                async with pr as r:
-                    log.debug(f'headers-{idx}: {r.headers}')
-                    log.debug(f'url-{idx}: {r.real_url}')
-                    log.debug(f'status-{idx}: {r.status}')
-
-                    r.raise_for_status()
-                    decoded_line = await r.text()
-                    if 'jQ1olc' in decoded_line:
-                        audio_search = re.search(r'jQ1olc","\[\\"(.*)\\"]', decoded_line)
-                        if audio_search:
-                            as_bytes = audio_search.group(1).encode('ascii')
-                            decoded = base64.b64decode(as_bytes)
-                            fp.write(decoded)
-                        else:
+        translate_url, payloads = self._prepare_requests(text, lang, tld, slow, lang_check)
+
+        # Google rate-limits aggressively parallel clients, keep it modest
+        semaphore = asyncio.Semaphore(4)
+
+        audio_parts = await asyncio.gather(
+            *(self._fetch_part(idx, translate_url, data, semaphore)
+              for idx, data in enumerate(payloads)))
+
+        try:
+            fp.write(b''.join(audio_parts))
+            log.debug(f'{len(audio_parts)} part(s) written to {fp}')
+        except (AttributeError, TypeError) as e:
+            raise TypeError(f"'fp' is not a file-like object or it does not take bytes: {e}")
+
+    # HTTP statuses worth a retry before giving up on a chunk
+    _RETRY_STATUSES = (429, 500, 502, 503, 504)
+    _RETRY_ATTEMPTS = 3
+
+    async def _fetch_part(self, idx, translate_url, data, semaphore):
+        """POST a single RPC payload and return its decoded audio bytes.
+
+        Rate-limit and upstream errors (429, 5xx) are retried a couple of
+        times with exponential backoff and jitter on the pooled
+        connection; everything else fails the chunk immediately.
+        """
+
+        async with semaphore:
+            for attempt in range(self._RETRY_ATTEMPTS):
+                try:
+                    async with self.session.post(translate_url, data=data, headers=self._GOOGLE_TTS_HEADERS_MD) as r:
+                        log.debug(f'headers-{idx}: {r.headers}')
+                        log.debug(f'url-{idx}: {r.real_url}')
+                        log.debug(f'status-{idx}: {r.status}')
+
+                        r.raise_for_status()
+                        body = await r.read()
+                        audio_search = _AUDIO_RE.search(body)
+                        if not audio_search:
                             raise aiogTTSError(tts=self, response=r)
-                log.debug(f'part-{idx} written to {fp}')
-            except (AttributeError, TypeError) as e:
-                raise TypeError(f"'fp' is not a file-like object or it does not take bytes: {e}")
-
-            except aiohttp.ClientResponseError as e:
-                log.debug(e.message)
-                raise aiogTTSError(tts=self, response=r)
-            except aiohttp.ClientConnectionError as e:
-                log.debug(str(e))
-                raise aiogTTSError(tts=self)
+                        return base64.b64decode(audio_search.group(1))
+                except aiohttp.ClientResponseError as e:
+                    log.debug(e.message)
+                    if e.status in self._RETRY_STATUSES and attempt < self._RETRY_ATTEMPTS - 1:
+                        await asyncio.sleep(0.1 * 2 ** attempt + random.random() * 0.05)
+                        continue
+                    raise aiogTTSError(tts=self, response=r)
+                except aiohttp.ClientConnectionError as e:
+                    log.debug(str(e))
+                    raise aiogTTSError(tts=self)
 
     async def save(self, text, filename, lang='en', tld='com', slow=False, lang_check=True):
         """Do the TTS API request and write result to file.
@@ -1,9 +1,7 @@
 from aiogtts.utils import _translate_url
-from bs4 import BeautifulSoup
 import asyncio
 import aiohttp
 import logging
-import js2py
 import json
 import sys
 import re
@@ -11,6 +9,10 @@ import re
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+_SCRIPT_RE = re.compile(rb'<script[^>]*>\s*(AF_initDataCallback\(.*?\))\s*;?\s*</script>', re.DOTALL)
+_KEY_RE = re.compile(r"key\s*:\s*'([^']+)'")
+_DATA_RE = re.compile(r'data\s*:\s*(\[.*\])\s*,\s*sideChannel', re.DOTALL)
+
 # This file is used to generate the language dict (as a module)
 # Needs cleaning up, very much WIP
 # Usage:
@@ -18,28 +20,30 @@ log.addHandler(logging.NullHandler())
 # * $ python gen_langs.py <path to aiogtts>/langs.py
 
 
-def _get_data_by_key(js_list):
-    """JavaScript function to generate the languages.
+def _parse_script(js):
+    """Extract the 'key' and 'data' members of one payload.
 
-    A payload with the languages is passed to a JavaScript function.
-    Instead of parsing that payload (cumbersome), we 'overload' that
-    function to return what we want.
+    The argument of each AF_initDataCallback() call is a JavaScript
+    object literal, but its 'data' member is a plain JSON array, so two
+    targeted regexes plus json.loads replace the previous js2py
+    evaluation of the whole payload.
 
+    Returns:
+        tuple: ``(key, data)``, or ``None`` if the payload has neither.
     """
 
-    js_function = """
-        function AF_initDataCallback(args) {
-            return { key: args['key'], data: args['data'] };
-        };
-    """
+    key_search = _KEY_RE.search(js)
+    data_search = _DATA_RE.search(js)
+    if not (key_search and data_search):
+        return None
+    return key_search.group(1), json.loads(data_search.group(1))
+
 
-    data_by_key = {}
-    for js in js_list:
-        js_code = js_function + js
-        py_eval = js2py.eval_js(js_code)
-        data_by_key[py_eval['key']] = py_eval['data']
+async def _get_data_by_key(js_list):
+    """Parse the payloads concurrently; each block is independent."""
 
-    return data_by_key
+    results = await asyncio.gather(*(asyncio.to_thread(_parse_script, js) for js in js_list))
+    return dict(result for result in results if result)
 
 
 async def _fetch_langs(tld='com'):
@@ -70,14 +74,18 @@ async def _fetch_langs(tld='com'):
 
     async with aiohttp.ClientSession() as s:
         async with s.get(_translate_url(tld), headers=headers) as r:
-            page = await r.content.read()
+            page = await r.read()
 
-    soup = BeautifulSoup(page, 'html.parser')
+    # Extract the '<script>AF_initDataCallback(...)</script>' payloads directly;
+    # no need to build a DOM of the whole landing page for that
+    scripts = [m.group(1).decode('utf-8') for m in _SCRIPT_RE.finditer(page)]
 
-    scripts = soup.find_all(name='script', string=re.compile(r'^AF_initDataCallback'))
-    scripts = [s.next for s in scripts]
+    # Only the 'ds:3' (all languages) and 'ds:6' (TTS-enabled codes)
+    # payloads are needed; don't waste time evaluating the other blocks
+    wanted_keys = ("'ds:3'", "'ds:6'")
+    scripts = [s for s in scripts if any(key in s for key in wanted_keys)]
 
-    data_by_key = _get_data_by_key(scripts)
+    data_by_key = await _get_data_by_key(scripts)
 
     # Get all languages (ds:3)
     # data for 'ds:3' is
@@ -16,7 +16,7 @@ setup(
 
     url='https://github.com/Helow19274/aiogTTS',
     packages=['aiogtts', 'aiogtts/tokenizer'],
-    install_requires=['aiohttp', 'beautifulsoup4'],
+    install_requires=['aiohttp', 'multidict', 'yarl'],
     extras_require={'tests': ['pytest-asyncio']},
 
     classifiers=[
@@ -45,6 +45,12 @@ def test_tokenizer():
     assert t.run(_in) == _out
 
 
+def test_tokenizer_iter_run():
+    t = Tokenizer([case1, case2])
+    _in = "Hello, my name is Linda a. Call me Lin, b. I'm your friend"
+    assert list(t.iter_run(_in)) == t.run(_in)
+
+
 def test_bad_params_not_list():
     with pytest.raises(TypeError):
         Tokenizer(case1)
@@ -140,6 +140,26 @@ def test_infer_msg():
     assert error100.msg == '100 (ddd) from TTS API. Probable cause: Unknown'
 
 
+@pytest.mark.asyncio
+async def test_context_manager_closes_session():
+    """'async with' closes the lazily-created session"""
+    async with aiogTTS() as tts:
+        session = tts.session
+        assert not session.closed
+
+    assert session.closed
+    assert tts.s is None
+
+
+@pytest.mark.asyncio
+async def test_close_without_session():
+    """close() is a no-op if no session was ever created"""
+    tts = aiogTTS()
+    await tts.close()
+
+    assert tts.s is None
+
+
 @pytest.mark.asyncio
 async def test_web_request(tmp_path):
     """Test Web Requests"""